@@ -56,7 +56,7 @@ A quick introductory example:
 >>> # Depth first search rooted on node X
 >>> st, pre, post = depth_first_search(gr, root='X')
 >>> # Print the spanning tree
->>> print st
+>>> print(st)
 {'A': 'B', 'C': 'A', 'B': 'Y', 'Y': 'X', 'X': None, 'Z': 'X'}
 """
 
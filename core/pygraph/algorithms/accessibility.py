@@ -30,6 +30,7 @@ Accessibility algorithms.
 
 
 # Imports
+from pygraph.classes.csr import csr
 from sys import getrecursionlimit, setrecursionlimit
 
 # Transitive-closure
@@ -38,28 +39,109 @@ def accessibility(graph):
     """
     Accessibility matrix (transitive closure).
 
-    @type  graph: graph, digraph, hypergraph
+    @type  graph: graph, digraph, hypergraph, csr
     @param graph: Graph.
 
     @rtype:  dictionary
     @return: Accessibility information for each node.
     """
+    # Snapshots are closed over the CSR arrays using bitsets
+    if (isinstance(graph, csr)):
+        return _accessibility_csr(graph)
+    
     recursionlimit = getrecursionlimit()
-    setrecursionlimit(max(len(graph.nodes())*2,recursionlimit))
+    setrecursionlimit(max(len(graph)*2,recursionlimit))
     
     accessibility = {}        # Accessibility matrix
 
     # For each node i, mark each node j if that exists a path from i to j.
-    for each in graph:
+    for each in graph.iter_nodes():
         access = {}
         # Perform DFS to explore all reachable nodes
         _dfs(graph, access, 1, each)
-        accessibility[each] = list(access.keys())
+        accessibility[each] = list(access)
     
     setrecursionlimit(recursionlimit)
     return accessibility
 
 
+def _accessibility_csr(graph):
+    """
+    Accessibility matrix (transitive closure) of a snapshot.
+    
+    Nodes reachable from each node are kept as a bitset in a Python integer, with bit C{i} set for
+    the node numbered C{i}. Strongly connected components are found with an iterative version of
+    Tarjan's algorithm, which completes every component after all components it reaches. The
+    bitset of a component is then the union of its members and the bitsets of its successors.
+    
+    @type  graph: csr
+    @param graph: Snapshot.
+
+    @rtype:  dictionary
+    @return: Accessibility information for each node. Nodes are listed in snapshot order.
+    """
+    node_list = graph.node_list
+    indptr = graph.indptr
+    indices = graph.indices
+    n = len(node_list)
+    
+    reach = [0] * n         # Bitset of nodes accessible from each node
+    num = [-1] * n          # Discovery number of each node
+    low = [0] * n           # Lowest discovery number reachable from each node's subtree
+    on_stack = bytearray(n)
+    stack = []
+    count = 0
+    
+    for root in range(n):
+        if (num[root] >= 0):
+            continue
+        num[root] = low[root] = count
+        count = count + 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [[root, indptr[root]]]   # Nodes being explored and the position of their next edge
+        while (work):
+            frame = work[-1]
+            v, k = frame
+            if (k < indptr[v+1]):
+                frame[1] = k + 1
+                w = indices[k]
+                if (num[w] < 0):
+                    num[w] = low[w] = count
+                    count = count + 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append([w, indptr[w]])
+                elif (on_stack[w] and num[w] < low[v]):
+                    low[v] = num[w]
+                continue
+            work.pop()
+            if (work and low[v] < low[work[-1][0]]):
+                low[work[-1][0]] = low[v]
+            if (low[v] == num[v]):
+                # v roots a component whose successors outside it are all complete
+                component = []
+                closure = 0
+                while (True):
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component.append(w)
+                    closure = closure | (1 << w)
+                    if (w == v):
+                        break
+                for w in component:
+                    for k in range(indptr[w], indptr[w+1]):
+                        closure = closure | reach[indices[k]]
+                for w in component:
+                    reach[w] = closure
+    
+    accessibility = {}
+    for i in range(n):
+        bits = bin(reach[i])[:1:-1]
+        accessibility[node_list[i]] = [node_list[j] for j, bit in enumerate(bits) if (bit == '1')]
+    return accessibility
+
+
 # Strongly connected components
 
 def mutual_accessibility(graph):
@@ -73,7 +155,7 @@ def mutual_accessibility(graph):
     @return: Mutual-accessibility information for each node.
     """
     recursionlimit = getrecursionlimit()
-    setrecursionlimit(max(len(graph.nodes())*2,recursionlimit))
+    setrecursionlimit(max(len(graph)*2,recursionlimit))
     
     mutual_access = {}
     stack = []
@@ -102,7 +184,7 @@ def mutual_accessibility(graph):
             for item in component:
                 low[item] = len(graph)
     
-    for node in graph:
+    for node in graph.iter_nodes():
         visit(node)
     
     setrecursionlimit(recursionlimit)
@@ -122,14 +204,14 @@ def connected_components(graph):
     @return: Pairing that associates each node to its connected component.
     """
     recursionlimit = getrecursionlimit()
-    setrecursionlimit(max(len(graph.nodes())*2,recursionlimit))
+    setrecursionlimit(max(len(graph)*2,recursionlimit))
     
     visited = {}
     count = 1
 
     # For 'each' node not found to belong to a connected component, find its connected
     # component.
-    for each in graph:
+    for each in graph.iter_nodes():
         if (each not in visited):
             _dfs(graph, visited, count, each)
             count = count + 1
@@ -193,7 +275,7 @@ def cut_edges(graph):
     @return: List of cut-edges.
     """
     recursionlimit = getrecursionlimit()
-    setrecursionlimit(max(len(graph.nodes())*2,recursionlimit))
+    setrecursionlimit(max(len(graph)*2,recursionlimit))
 
     # Dispatch if we have a hypergraph
     if 'hypergraph' == graph.__class__.__name__:
@@ -205,7 +287,7 @@ def cut_edges(graph):
     reply = []
     pre[None] = 0
 
-    for each in graph:
+    for each in graph.iter_nodes():
         if (each not in pre):
             spanning_tree[each] = None
             _cut_dfs(graph, spanning_tree, pre, low, reply, each)
@@ -248,7 +330,7 @@ def cut_nodes(graph):
     @return: List of cut-nodes.
     """
     recursionlimit = getrecursionlimit()
-    setrecursionlimit(max(len(graph.nodes())*2,recursionlimit))
+    setrecursionlimit(max(len(graph)*2,recursionlimit))
     
     # Dispatch if we have a hypergraph
     if 'hypergraph' == graph.__class__.__name__:
@@ -261,13 +343,13 @@ def cut_nodes(graph):
     pre[None] = 0
     
     # Create spanning trees, calculate pre[], low[]
-    for each in graph:
+    for each in graph.iter_nodes():
         if (each not in pre):
             spanning_tree[each] = None
             _cut_dfs(graph, spanning_tree, pre, low, [], each)
 
     # Find cuts
-    for each in graph:
+    for each in graph.iter_nodes():
         # If node is not a root
         if (spanning_tree[each] is not None):
             for other in graph[each]:
@@ -277,7 +359,7 @@ def cut_nodes(graph):
         # If node is a root
         else:
             children = 0
-            for other in graph:
+            for other in graph.iter_nodes():
                 if (spanning_tree[other] == each):
                     children = children + 1
             # root is cut-vertex iff it has two or more children
@@ -285,7 +367,7 @@ def cut_nodes(graph):
                 reply[each] = 1
 
     setrecursionlimit(recursionlimit)
-    return list(reply.keys())
+    return list(reply)
 
 
 def _cut_hypernodes(hypergraph):
@@ -87,14 +87,14 @@ def find_cycle(graph):
                     cycle.extend(find_cycle_to_ancestor(node, each))
 
     recursionlimit = getrecursionlimit()
-    setrecursionlimit(max(len(graph.nodes())*2,recursionlimit))
+    setrecursionlimit(max(len(graph)*2,recursionlimit))
 
     visited = {}              # List for marking visited and non-visited nodes
     spanning_tree = {}        # Spanning tree
     cycle = []
 
     # Algorithm outer-loop
-    for each in graph:
+    for each in graph.iter_nodes():
         # Select a non-visited node
         if (each not in visited):
             spanning_tree[each] = None
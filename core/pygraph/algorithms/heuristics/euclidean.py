@@ -67,8 +67,8 @@ class euclidean(object):
         @type  graph: graph
         @param graph: Graph. 
         """
-        for start in graph.nodes():
-            for end in graph.nodes():
+        for start in graph.iter_nodes():
+            for end in graph.iter_nodes():
                 for each in graph.node_attributes(start):
                     if (each[0] == 'position'):
                         start_attr = each[1]
@@ -92,6 +92,6 @@ class euclidean(object):
         @type  end: node
         @param end: End node.
         """
-        assert len(list(self.distances.keys())) > 0, "You need to optimize this heuristic for your graph before it can be used to estimate."
+        assert len(self.distances) > 0, "You need to optimize this heuristic for your graph before it can be used to estimate."
                 
         return self.distances[(start,end)]
\ No newline at end of file
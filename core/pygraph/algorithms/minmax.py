@@ -39,7 +39,12 @@ from pygraph.algorithms.utils import heappush, heappop
 from pygraph.classes.exceptions import NodeUnreachable
 from pygraph.classes.exceptions import NegativeWeightCycleError
 from pygraph.classes.digraph import digraph
-import bisect
+from pygraph.classes.csr import csr
+from array import array
+
+# Snapshots with small integer weights are searched with a bucket queue while the number of
+# buckets it may scan stays within this multiple of the snapshot's nodes and edges
+_BUCKET_SCAN_RATIO = 16
 
 # Minimal spanning tree
 
@@ -99,7 +104,7 @@ def _first_unvisited(graph, visited):
     @rtype:  node
     @return: First unvisited node.
     """
-    for each in graph:
+    for each in graph.iter_nodes():
         if (each not in visited):
             return each
     return None
@@ -121,9 +126,8 @@ def _lightest_edge(graph, visited):
     lightest_edge = None
     weight = None
     for each in visited:
-        for other in graph[each]:
+        for other, w in graph.neighbors_with_weights(each):
             if (other not in visited):
-                w = graph.edge_weight((each, other))
                 if (weight is None or w < weight or weight < 0):
                     lightest_edge = (each, other)
                     weight = w
@@ -141,7 +145,7 @@ def shortest_path(graph, source):
     
     @see: shortest_path_bellman_ford
 
-    @type  graph: graph, digraph
+    @type  graph: graph, digraph, csr
     @param graph: Graph.
 
     @type  source: node
@@ -153,14 +157,18 @@ def shortest_path(graph, source):
         2. Shortest distance from given source to each target node
     Inaccessible target nodes do not appear in either dictionary.
     """
+    # Snapshots are searched directly over the CSR arrays
+    if (isinstance(graph, csr)):
+        return _shortest_path_csr(graph, source)
+    
     # Initialization
     dist     = {source: 0}
     previous = {source: None}
 
-    # This is a sorted queue of (dist, node) 2-tuples. The first item in the
-    # queue is always either a finalized node that we can ignore or the node
+    # This is a binary heap of (dist, node) 2-tuples. The first item in the
+    # heap is always either a finalized node that we can ignore or the node
     # with the smallest estimated distance from the source. Note that we will
-    # not remove nodes from this list as they are finalized; we just ignore them
+    # not remove nodes from this heap as they are finalized; we just ignore them
     # when they come up.
     q = [(0, source)]
 
@@ -169,22 +177,154 @@ def shortest_path(graph, source):
 
     # Algorithm loop
     while len(q) > 0:
-        du, u = q.pop(0)
+        du, u = heappop(q)
 
         # Process reachable, remaining nodes from u
         if u not in finished:
             finished.add(u)
-            for v in graph[u]:
+            for v, w in graph.neighbors_with_weights(u):
                 if v not in finished:
-                    alt = du + graph.edge_weight((u, v))
+                    alt = du + w
                     if (v not in dist) or (alt < dist[v]):
                         dist[v] = alt
                         previous[v] = u
-                        bisect.insort(q, (alt, v))
+                        heappush(q, (alt, v))
 
     return previous, dist
 
 
+def _shortest_path_csr(graph, source):
+    """
+    Dijkstra's algorithm over the arrays of a CSR snapshot.
+    
+    Snapshots with nonnegative integer weights packed in an array use Dial's bucket queue when the distances it may
+    have to scan are bounded by C{_BUCKET_SCAN_RATIO} times the size of the snapshot. Others use a
+    binary heap.
+    
+    @type  graph: csr
+    @param graph: Graph snapshot.
+
+    @type  source: node
+    @param source: Node from which to start the search.
+
+    @rtype:  tuple
+    @return: Same as shortest_path().
+    """
+    node_list = graph.node_list
+    weights = graph.weights
+    n = len(node_list)
+    root = graph.node_ids[source]
+    
+    if (isinstance(weights, array) and weights.typecode == 'l' and len(weights) > 0 and min(weights) >= 0 and
+        max(weights) * n <= _BUCKET_SCAN_RATIO * (n + len(weights))):
+        dist, previous = _dial_csr(graph, root, max(weights))
+    else:
+        dist, previous = _dijkstra_csr(graph, root)
+    
+    # Translate ids back into nodes
+    reached = [i for i in range(n) if dist[i] is not None]
+    distances = dict((node_list[i], dist[i]) for i in reached)
+    spanning_tree = dict((node_list[i], node_list[previous[i]]) for i in reached if i != root)
+    spanning_tree[source] = None
+    return spanning_tree, distances
+
+
+def _dijkstra_csr(graph, root):
+    """
+    Dijkstra's algorithm over the arrays of a CSR snapshot using a binary heap.
+    
+    @type  graph: csr
+    @param graph: Graph snapshot.
+
+    @type  root: number
+    @param root: Id of the node from which to start the search.
+
+    @rtype:  tuple
+    @return: Distance and predecessor lists indexed by node id; None marks unreached nodes.
+    """
+    indptr = graph.indptr
+    indices = graph.indices
+    weights = graph.weights
+    n = len(graph.node_list)
+    
+    dist = [None] * n
+    previous = [None] * n
+    finished = bytearray(n)
+    dist[root] = 0
+    
+    # Binary heap of (dist, node id) tuples; entries of finalized nodes are skipped when popped
+    q = [(0, root)]
+    while (q):
+        du, u = heappop(q)
+        if (finished[u]):
+            continue
+        finished[u] = 1
+        for k in range(indptr[u], indptr[u+1]):
+            v = indices[k]
+            if (not finished[v]):
+                alt = du + weights[k]
+                if (dist[v] is None or alt < dist[v]):
+                    dist[v] = alt
+                    previous[v] = u
+                    heappush(q, (alt, v))
+    
+    return dist, previous
+
+
+def _dial_csr(graph, root, max_weight):
+    """
+    Dial's algorithm over the arrays of a CSR snapshot with nonnegative integer weights.
+    
+    Nodes wait in a bucket per tentative distance. Since no edge is heavier than C{max_weight},
+    pending distances always fall within C{max_weight + 1} consecutive values, so buckets are
+    reused circularly and are scanned in increasing distance order without any heap.
+    
+    @type  graph: csr
+    @param graph: Graph snapshot.
+
+    @type  root: number
+    @param root: Id of the node from which to start the search.
+
+    @type  max_weight: number
+    @param max_weight: Weight of the heaviest edge in the snapshot.
+
+    @rtype:  tuple
+    @return: Distance and predecessor lists indexed by node id; None marks unreached nodes.
+    """
+    indptr = graph.indptr
+    indices = graph.indices
+    weights = graph.weights
+    n = len(graph.node_list)
+    
+    dist = [None] * n
+    previous = [None] * n
+    dist[root] = 0
+    
+    size = max_weight + 1
+    buckets = [[] for i in range(size)]
+    buckets[0].append(root)
+    pending = 1             # Entries in all buckets, including outdated ones
+    d = 0
+    while (pending):
+        bucket = buckets[d % size]
+        # Zero-weight edges may add to the bucket being emptied
+        while (bucket):
+            u = bucket.pop()
+            pending = pending - 1
+            if (dist[u] != d):
+                continue
+            for k in range(indptr[u], indptr[u+1]):
+                v = indices[k]
+                alt = d + weights[k]
+                if (dist[v] is None or alt < dist[v]):
+                    dist[v] = alt
+                    previous[v] = u
+                    buckets[alt % size].append(v)
+                    pending = pending + 1
+        d = d + 1
+    
+    return dist, previous
+
 
 def shortest_path_bellman_ford(graph, source):
     """
@@ -347,10 +487,10 @@ def maximum_flow(graph, source, sink, caps = None):
     
     #data structures to maintain
     f = {}.fromkeys(graph.edges(),0)    
-    label = {}.fromkeys(graph.nodes(),[])
+    label = {}.fromkeys(graph.iter_nodes(),[])
     label[source] = ['-',float('Inf')]
-    u = {}.fromkeys(graph.nodes(),False)
-    d = {}.fromkeys(graph.nodes(),float('Inf'))
+    u = {}.fromkeys(graph.iter_nodes(),False)
+    d = {}.fromkeys(graph.iter_nodes(),float('Inf'))
     #queue for labelling
     q = [source]
 
@@ -388,21 +528,21 @@ def maximum_flow(graph, source, sink, caps = None):
                     f[(v,w)] = f[(v,w)] + delta
                 w = v
             #reset labels
-            label = {}.fromkeys(graph.nodes(),[])
+            label = {}.fromkeys(graph.iter_nodes(),[])
             label[source] = ['-',float('Inf')]
             q = [source]
-            u = {}.fromkeys(graph.nodes(),False)
-            d = {}.fromkeys(graph.nodes(),float('Inf'))
+            u = {}.fromkeys(graph.iter_nodes(),False)
+            d = {}.fromkeys(graph.iter_nodes(),float('Inf'))
 
         #check whether finished
         finished = True
-        for node in graph.nodes():
+        for node in graph.iter_nodes():
             if label[node] != [] and u[node] == False:
                 finished = False
 
     #find the two components of the cut
     cut = {}
-    for node in graph.nodes():
+    for node in graph.iter_nodes():
         if label[node] == []:
             cut[node] = 1
         else:
@@ -429,7 +569,7 @@ def cut_value(graph, flow, cut):
     #max flow/min cut value calculation
     S = []
     T = []
-    for node in cut.keys():
+    for node in cut:
         if cut[node] == 0:
             S.append(node)
         elif cut[node] == 1:
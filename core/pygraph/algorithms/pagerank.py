@@ -57,6 +57,9 @@ def pagerank(graph, damping_factor=0.85, max_iterations=100, min_delta=0.00001):
     
     # itialize the page rank dict with 1/N for all nodes
     pagerank = dict.fromkeys(nodes, 1.0/graph_size)
+    
+    # number of outbound links of each node
+    out_links = dict((node, graph.node_order(node)) for node in nodes)
         
     for i in range(max_iterations):
         diff = 0 #total difference compared to last iteraction
@@ -64,7 +67,7 @@ def pagerank(graph, damping_factor=0.85, max_iterations=100, min_delta=0.00001):
         for node in nodes:
             rank = min_value
             for referring_page in graph.incidents(node):
-                rank += damping_factor * pagerank[referring_page] / len(graph.neighbors(referring_page))
+                rank += damping_factor * pagerank[referring_page] / out_links[referring_page]
                 
             diff += abs(pagerank[node] - rank)
             pagerank[node] = rank
@@ -31,7 +31,8 @@ Search algorithms.
 
 # Imports
 from pygraph.algorithms.filters.null import null
-from sys import getrecursionlimit, setrecursionlimit
+from pygraph.classes.csr import csr
+from collections import deque
 
 
 # Depth-first search
@@ -40,7 +41,7 @@ def depth_first_search(graph, root=None, filter=null()):
     """
     Depth-first search.
 
-    @type  graph: graph, digraph
+    @type  graph: graph, digraph, csr
     @param graph: Graph.
     
     @type  root: node
@@ -52,22 +53,33 @@ def depth_first_search(graph, root=None, filter=null()):
         2. Graph's preordering
         3. Graph's postordering
     """
-    
-    recursionlimit = getrecursionlimit()
-    setrecursionlimit(max(len(graph.nodes())*2,recursionlimit))
 
-    def dfs(node):
+    # Unfiltered searches on snapshots run directly over the CSR arrays
+    if (isinstance(graph, csr) and type(filter) is null):
+        return _depth_first_search_csr(graph, root)
+
+    def dfs(root):
         """
         Depth-first search subfunction.
+        
+        The connected component is explored with an explicit stack of neighbor iterators
+        instead of recursion, so deep graphs do not hit the interpreter's recursion limit.
         """
-        visited[node] = 1
-        pre.append(node)
-        # Explore recursively the connected component
-        for each in graph[node]:
-            if (each not in visited and filter(each, node)):
-                spanning_tree[each] = node
-                dfs(each)
-        post.append(node)
+        visited[root] = 1
+        pre.append(root)
+        stack = [(root, iter(graph[root]))]
+        while (stack):
+            node, neighbors = stack[-1]
+            for each in neighbors:
+                if (each not in visited and filter(each, node)):
+                    spanning_tree[each] = node
+                    visited[each] = 1
+                    pre.append(each)
+                    stack.append((each, iter(graph[each])))
+                    break
+            else:
+                stack.pop()
+                post.append(node)
 
     visited = {}            # List for marking visited and non-visited nodes
     spanning_tree = {}      # Spanning tree
@@ -80,18 +92,15 @@ def depth_first_search(graph, root=None, filter=null()):
         if filter(root, None):
             spanning_tree[root] = None
             dfs(root)
-        setrecursionlimit(recursionlimit)
         return spanning_tree, pre, post
     
     # Algorithm loop
-    for each in graph:
+    for each in graph.iter_nodes():
         # Select a non-visited node
         if (each not in visited and filter(each, None)):
             spanning_tree[each] = None
             # Explore node's connected component
             dfs(each)
-
-    setrecursionlimit(recursionlimit)
     
     return (spanning_tree, pre, post)
 
@@ -102,7 +111,7 @@ def breadth_first_search(graph, root=None, filter=null()):
     """
     Breadth-first search.
 
-    @type  graph: graph, digraph
+    @type  graph: graph, digraph, csr
     @param graph: Graph.
 
     @type  root: node
@@ -114,12 +123,16 @@ def breadth_first_search(graph, root=None, filter=null()):
         2. Graph's level-based ordering
     """
 
+    # Unfiltered searches on snapshots run directly over the CSR arrays
+    if (isinstance(graph, csr) and type(filter) is null):
+        return _breadth_first_search_csr(graph, root)
+
     def bfs():
         """
         Breadth-first search subfunction.
         """
-        while (queue != []):
-            node = queue.pop(0)
+        while (queue):
+            node = queue.popleft()
             
             for other in graph[node]:
                 if (other not in spanning_tree and filter(other, node)):
@@ -127,7 +140,7 @@ def breadth_first_search(graph, root=None, filter=null()):
                     ordering.append(other)
                     spanning_tree[other] = node
     
-    queue = []            # Visiting queue
+    queue = deque()       # Visiting queue
     spanning_tree = {}    # Spanning tree
     ordering = []
     filter.configure(graph, spanning_tree)
@@ -142,7 +155,7 @@ def breadth_first_search(graph, root=None, filter=null()):
         return spanning_tree, ordering
 
     # Algorithm
-    for each in graph:
+    for each in graph.iter_nodes():
         if (each not in spanning_tree):
             if filter(each, None):
                 queue.append(each)
@@ -151,3 +164,110 @@ def breadth_first_search(graph, root=None, filter=null()):
                 bfs()
 
     return spanning_tree, ordering
+
+
+# Searches over CSR snapshots
+
+def _depth_first_search_csr(graph, root):
+    """
+    Depth-first search over the arrays of a CSR snapshot.
+    
+    Visits nodes in the same order as depth_first_search() does on the source graph.
+
+    @type  graph: csr
+    @param graph: Graph snapshot.
+    
+    @type  root: node
+    @param root: Optional root node (will explore only root's connected component)
+
+    @rtype:  tuple
+    @return: Same as depth_first_search().
+    """
+    indptr = graph.indptr
+    indices = graph.indices
+    node_list = graph.node_list
+    visited = bytearray(len(node_list))
+    spanning_tree = {}
+    pre = []
+    post = []
+    
+    if (root is not None):
+        roots = [graph.node_ids[root]]
+    else:
+        roots = range(len(node_list))
+    
+    for each in roots:
+        if (visited[each]):
+            continue
+        visited[each] = 1
+        spanning_tree[node_list[each]] = None
+        pre.append(each)
+        # Stack of nodes being explored and the position of their next unexplored neighbor
+        stack = [each]
+        cursor = [indptr[each]]
+        while (stack):
+            node = stack[-1]
+            k = cursor[-1]
+            end = indptr[node+1]
+            while (k < end and visited[indices[k]]):
+                k = k + 1
+            if (k < end):
+                other = indices[k]
+                cursor[-1] = k + 1
+                visited[other] = 1
+                spanning_tree[node_list[other]] = node_list[node]
+                pre.append(other)
+                stack.append(other)
+                cursor.append(indptr[other])
+            else:
+                stack.pop()
+                cursor.pop()
+                post.append(node)
+    
+    return (spanning_tree, [node_list[i] for i in pre], [node_list[i] for i in post])
+
+
+def _breadth_first_search_csr(graph, root):
+    """
+    Breadth-first search over the arrays of a CSR snapshot.
+    
+    Visits nodes in the same order as breadth_first_search() does on the source graph.
+
+    @type  graph: csr
+    @param graph: Graph snapshot.
+    
+    @type  root: node
+    @param root: Optional root node (will explore only root's connected component)
+
+    @rtype:  tuple
+    @return: Same as breadth_first_search().
+    """
+    indptr = graph.indptr
+    indices = graph.indices
+    node_list = graph.node_list
+    visited = bytearray(len(node_list))
+    spanning_tree = {}
+    ordering = []           # Also used as the visiting queue
+    
+    if (root is not None):
+        roots = [graph.node_ids[root]]
+    else:
+        roots = range(len(node_list))
+    
+    for each in roots:
+        if (visited[each]):
+            continue
+        visited[each] = 1
+        spanning_tree[node_list[each]] = None
+        head = len(ordering)
+        ordering.append(each)
+        while (head < len(ordering)):
+            node = ordering[head]
+            head = head + 1
+            for other in indices[indptr[node]:indptr[node+1]]:
+                if (not visited[other]):
+                    visited[other] = 1
+                    spanning_tree[node_list[other]] = node_list[node]
+                    ordering.append(other)
+    
+    return spanning_tree, [node_list[i] for i in ordering]
@@ -25,12 +25,13 @@
 """
 Sorting algorithms.
 
-@sort: topological_sorting
+@sort: hybrid_bfsdeg, reverse_cuthill_mckee, topological_sorting
 """
 
 
 # Imports
 from pygraph.algorithms.searching import depth_first_search
+from pygraph.classes.csr import csr
 
 # Topological sorting
 def topological_sorting(graph):
@@ -49,3 +50,170 @@ def topological_sorting(graph):
     order = depth_first_search(graph)[2]
     order.reverse()
     return order
+
+
+# Locality-improving node orderings
+
+def reverse_cuthill_mckee(graph):
+    """
+    Reverse Cuthill-McKee ordering.
+    
+    Each connected component is traversed breadth-first from a pseudo-peripheral node, visiting
+    the neighbors of each node in increasing degree order, and the resulting ordering is
+    reversed. Adjacent nodes end up close to each other in this ordering, so numbering the nodes
+    of a frozen graph with it (see C{csr.reorder()}) improves memory locality of traversals.
+    
+    @attention: Reverse Cuthill-McKee ordering is meaningful only for undirected graphs. Directed
+    graphs are traversed along their edge directions, which still yields an ordering of all nodes.
+
+    @type  graph: graph, digraph, csr
+    @param graph: Graph.
+
+    @rtype:  list
+    @return: Reverse Cuthill-McKee ordering of the graph's nodes.
+    """
+    degree = _degrees(graph)
+    visited = set()
+    order = []
+    for each in sorted(graph.iter_nodes(), key=degree.get):
+        if (each not in visited):
+            root = _pseudo_peripheral_node(graph, degree, each)
+            # Following edge directions may lead to a node that was already ordered, or to one
+            # from which the starting node can't be reached
+            if (root not in visited):
+                _degree_ordered_bfs(graph, degree, root, visited, order, False)
+            if (each not in visited):
+                _degree_ordered_bfs(graph, degree, each, visited, order, False)
+    order.reverse()
+    return order
+
+
+def hybrid_bfsdeg(graph):
+    """
+    Hybrid breadth-first/degree ordering.
+    
+    Each connected component is traversed breadth-first from its node of highest degree,
+    visiting the neighbors of each node in decreasing degree order. High-degree nodes, which
+    are the most frequently accessed during traversals, get low and close ids while neighbors
+    stay close to each other. Like L{reverse_cuthill_mckee}, it's meant to be used to renumber
+    the nodes of frozen graphs.
+
+    @type  graph: graph, digraph, csr
+    @param graph: Graph.
+
+    @rtype:  list
+    @return: Hybrid breadth-first/degree ordering of the graph's nodes.
+    """
+    degree = _degrees(graph)
+    visited = set()
+    order = []
+    for each in sorted(graph.iter_nodes(), key=degree.get, reverse=True):
+        if (each not in visited):
+            _degree_ordered_bfs(graph, degree, each, visited, order, True)
+    return order
+
+
+def _degrees(graph):
+    """
+    Return the degree of each node.
+    
+    @type  graph: graph, digraph, csr
+    @param graph: Graph.
+    
+    @rtype:  dictionary
+    @return: Pairing of each node to its degree.
+    """
+    # Snapshots compute all degrees at once from their offsets
+    if (isinstance(graph, csr)):
+        return dict(zip(graph.node_list, graph.degrees()))
+    return dict((node, graph.node_order(node)) for node in graph.iter_nodes())
+
+
+def _degree_ordered_bfs(graph, degree, root, visited, order, reverse):
+    """
+    Breadth-first search visiting the neighbors of each node sorted by degree.
+    
+    @type  graph: graph, digraph, csr
+    @param graph: Graph.
+    
+    @type  degree: dictionary
+    @param degree: Pairing of each node to its degree.
+    
+    @type  root: node
+    @param root: Root node.
+    
+    @type  visited: set
+    @param visited: Set of visited nodes. Nodes visited by the search are added to it.
+    
+    @type  order: list
+    @param order: List of nodes in visiting order. Nodes visited by the search are appended to it.
+    
+    @type  reverse: boolean
+    @param reverse: Whether neighbors are visited in decreasing instead of increasing degree.
+    """
+    visited.add(root)
+    head = len(order)
+    order.append(root)
+    while (head < len(order)):
+        node = order[head]
+        head = head + 1
+        unvisited = [each for each in graph[node] if each not in visited]
+        unvisited.sort(key=degree.get, reverse=reverse)
+        visited.update(unvisited)
+        order.extend(unvisited)
+
+
+def _pseudo_peripheral_node(graph, degree, node):
+    """
+    Find a pseudo-peripheral node in the connected component of the given node.
+    
+    This is the heuristic by George and Liu: move to the lowest degree node among the farthest
+    nodes from the current one while that increases the eccentricity.
+    
+    @type  graph: graph, digraph, csr
+    @param graph: Graph.
+    
+    @type  degree: dictionary
+    @param degree: Pairing of each node to its degree.
+    
+    @type  node: node
+    @param node: Starting node.
+    
+    @rtype:  node
+    @return: Pseudo-peripheral node.
+    """
+    levels = _level_structure(graph, node)
+    while (True):
+        candidate = min(levels[-1], key=degree.get)
+        candidate_levels = _level_structure(graph, candidate)
+        if (len(candidate_levels) <= len(levels)):
+            return node
+        node = candidate
+        levels = candidate_levels
+
+
+def _level_structure(graph, root):
+    """
+    Return the nodes reachable from the given node grouped by distance.
+    
+    @type  graph: graph, digraph, csr
+    @param graph: Graph.
+    
+    @type  root: node
+    @param root: Root node.
+    
+    @rtype:  list
+    @return: List of levels, each one a list of the nodes at that distance from the root.
+    """
+    visited = set([root])
+    levels = [[root]]
+    while (True):
+        level = []
+        for node in levels[-1]:
+            for each in graph[node]:
+                if (each not in visited):
+                    visited.add(each)
+                    level.append(each)
+        if (not level):
+            return levels
+        levels.append(level)
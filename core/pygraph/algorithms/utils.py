@@ -85,5 +85,5 @@ class HeapItem:
         self.item = item
         self.priority = priority
 
-    def __cmp__(self, other):
-        return cmp(self.priority, other.priority)
+    def __lt__(self, other):
+        return self.priority < other.priority
@@ -0,0 +1,287 @@
+# Copyright (c) 2007-2009 Pedro Matiello <pmatiello@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+"""
+Frozen compressed sparse row (CSR) graph class.
+"""
+
+
+# Imports
+from array import array
+
+
+class csr(object):
+    """
+    Read-only snapshot of a graph or digraph in compressed sparse row form.
+
+    Nodes are numbered from C{0} to C{n-1} in the order the source graph iterates them. The
+    neighbors of the node numbered C{i} are C{indices[indptr[i]:indptr[i+1]]} and the weights
+    of the corresponding edges are stored at the same positions in C{weights}. Weights are packed
+    in an array when they are all integers that fit a C long or all floats, and kept in a list
+    otherwise.
+
+    Snapshots are built with C{graph.freeze()}. They provide the read-only part of the graph
+    interface, so they can be passed to any algorithm that doesn't need node incidence. Some
+    algorithms recognize snapshots and run specialized versions over the flat arrays.
+
+    @attention: Changes to the source graph are not reflected in the snapshot.
+
+    @sort:  __init__, __getitem__, __iter__, __len__, degrees, edge_weight, edges, has_edge,
+    has_node, iter_nodes, neighbors, neighbors_with_weights, node_order, nodes, order, reorder
+    """
+
+    def __init__(self, graph, order=None):
+        """
+        Build a snapshot of the given graph.
+
+        @type  graph: graph, digraph, csr
+        @param graph: Graph.
+
+        @type  order: list
+        @param order: Optional list of all nodes in the order they should be numbered. Nodes are
+        numbered in the graph's iteration order by default.
+        """
+        if (order is None):
+            order = list(graph)
+        self.DIRECTED = graph.DIRECTED
+        self.node_list = list(order)                    # Pairing: Id -> Node
+        self.node_ids = dict((node, i) for i, node in enumerate(self.node_list))  # Pairing: Node -> Id
+        self.indptr = array('i', [0])                   # Offsets of each node's neighbors
+        self.indices = array('i')                       # Neighbor ids
+
+        if (len(self.node_ids) != len(self.node_list) or len(self.node_list) != len(graph) or
+            any(not graph.has_node(each) for each in self.node_list)):
+            raise ValueError("Node order must list every node of the graph exactly once")
+
+        node_ids = self.node_ids
+        weights = []
+        for node in self.node_list:
+            for each, wt in graph.neighbors_with_weights(node):
+                self.indices.append(node_ids[each])
+                weights.append(wt)
+            self.indptr.append(len(self.indices))
+
+        # Weights are packed only when the array holds them exactly; any others, such as huge
+        # integers, fractions or non-numeric weights, are kept as they are in a list
+        self.weights = weights
+        if (all(type(wt) is int for wt in weights)):
+            try:
+                self.weights = array('l', weights)
+            except OverflowError:
+                pass
+        elif (all(type(wt) is float for wt in weights)):
+            self.weights = array('d', weights)
+
+    def reorder(self, order):
+        """
+        Return a copy of the snapshot with nodes renumbered in the given order.
+
+        Numbering nodes so that neighbors get close ids, as the orderings computed by
+        L{reverse_cuthill_mckee<pygraph.algorithms.sorting.reverse_cuthill_mckee>} do, improves
+        the memory locality of algorithms running over the snapshot arrays.
+
+        @type  order: list
+        @param order: List of all nodes in the order they should be numbered.
+
+        @rtype:  csr
+        @return: Reordered snapshot.
+        """
+        return csr(self, order)
+
+    def nodes(self):
+        """
+        Return node list.
+
+        @rtype:  list
+        @return: Node list.
+        """
+        return list(self.node_list)
+
+    def neighbors(self, node):
+        """
+        Return all nodes that are directly accessible from given node.
+
+        @type  node: node
+        @param node: Node identifier
+
+        @rtype:  list
+        @return: List of nodes directly accessible from given node.
+        """
+        i = self.node_ids[node]
+        node_list = self.node_list
+        return [node_list[each] for each in self.indices[self.indptr[i]:self.indptr[i+1]]]
+
+    def neighbors_with_weights(self, node):
+        """
+        Return all nodes that are directly accessible from given node paired with the weights
+        of the edges reaching them.
+
+        @type  node: node
+        @param node: Node identifier
+
+        @rtype:  list
+        @return: List of (neighbor, weight) tuples.
+        """
+        i = self.node_ids[node]
+        node_list = self.node_list
+        start = self.indptr[i]
+        end = self.indptr[i+1]
+        return [ (node_list[j], wt) for j, wt in zip(self.indices[start:end], self.weights[start:end]) ]
+
+    def edges(self):
+        """
+        Return all edges in the graph.
+
+        @rtype:  list
+        @return: List of all edges in the graph.
+        """
+        node_list = self.node_list
+        indptr = self.indptr
+        indices = self.indices
+        return [ (node_list[i], node_list[indices[k]])
+                 for i in range(len(node_list)) for k in range(indptr[i], indptr[i+1]) ]
+
+    def has_node(self, node):
+        """
+        Return whether the requested node exists.
+
+        @type  node: node
+        @param node: Node identifier
+
+        @rtype:  boolean
+        @return: Truth-value for node existence.
+        """
+        return node in self.node_ids
+
+    def has_edge(self, edge):
+        """
+        Return whether an edge exists.
+
+        @type  edge: tuple
+        @param edge: Edge.
+
+        @rtype:  boolean
+        @return: Truth-value for edge existence.
+        """
+        return self._edge_position(edge) is not None
+
+    def edge_weight(self, edge):
+        """
+        Get the weight of an edge.
+
+        @type  edge: edge
+        @param edge: One edge.
+
+        @rtype:  number
+        @return: Edge weight.
+        """
+        k = self._edge_position(edge)
+        if (k is None):
+            raise KeyError(edge)
+        return self.weights[k]
+
+    def _edge_position(self, edge):
+        """
+        Return the position of the given edge in C{indices} and C{weights}.
+
+        @type  edge: edge
+        @param edge: One edge.
+
+        @rtype:  number
+        @return: Position of the edge, or None if the edge doesn't exist.
+        """
+        u, v = edge
+        if (u not in self.node_ids or v not in self.node_ids):
+            return None
+        i = self.node_ids[u]
+        j = self.node_ids[v]
+        for k in range(self.indptr[i], self.indptr[i+1]):
+            if (self.indices[k] == j):
+                return k
+        return None
+
+    def node_order(self, node):
+        """
+        Return the order of the given node.
+
+        @rtype:  number
+        @return: Order of the given node.
+        """
+        i = self.node_ids[node]
+        return self.indptr[i+1] - self.indptr[i]
+
+    def degrees(self):
+        """
+        Return the order of every node, indexed by node id.
+
+        @rtype:  array
+        @return: Array of node orders.
+        """
+        indptr = self.indptr
+        return array('i', [indptr[i+1] - indptr[i] for i in range(len(self.node_list))])
+
+    def order(self):
+        """
+        Return the order of self, this is defined as the number of nodes in the graph.
+
+        @rtype:  number
+        @return: Size of the graph.
+        """
+        return len(self.node_list)
+
+    def __len__(self):
+        """
+        Return the order of self when requested by len().
+
+        @rtype:  number
+        @return: Size of the graph.
+        """
+        return len(self.node_list)
+
+    def __iter__(self):
+        """
+        Return a iterator passing through all nodes in the graph.
+
+        @rtype:  iterator
+        @return: Iterator passing through all nodes in the graph.
+        """
+        return iter(self.node_list)
+
+    def iter_nodes(self):
+        """
+        Return a iterator passing through all nodes in the graph.
+
+        @rtype:  iterator
+        @return: Iterator passing through all nodes in the graph.
+        """
+        return iter(self.node_list)
+
+    def __getitem__(self, node):
+        """
+        Return a iterator passing through all neighbors of the given node.
+
+        @rtype:  iterator
+        @return: Iterator passing through all neighbors of the given node.
+        """
+        return iter(self.neighbors(node))
@@ -30,6 +30,7 @@ Digraph class
 
 # Imports
 from pygraph.classes.exceptions import AdditionError
+from pygraph.classes.csr import csr
 from pygraph.mixins.labeling import labeling
 from pygraph.mixins.common import common
 from pygraph.mixins.basegraph import basegraph
@@ -40,10 +41,13 @@ class digraph (basegraph, common, labeling):
     
     Digraphs are built of nodes and directed edges.
 
-    @sort: __eq__, __init__, __ne__, add_edge, add_node, del_edge, del_node, edges, has_edge, has_node,
-    incidents, neighbors, node_order, nodes 
+    @sort: __eq__, __getitem__, __init__, __iter__, __len__, __ne__, add_edge, add_edges, add_node, add_nodes, del_edge, del_edges, del_node, edges, freeze, get_edge_properties, has_edge, has_node, iter_nodes,
+    incidents, neighbors, neighbors_with_weights, node_order, nodes, order 
     """
     
+    # __dict__ keeps user attributes such as name, used by the dot writer
+    __slots__ = ('node_neighbors', 'node_incidence', '__dict__', '__weakref__')
+    
     DIRECTED = True
 
     def __init__(self):
@@ -52,8 +56,10 @@ class digraph (basegraph, common, labeling):
         """
         common.__init__(self)
         labeling.__init__(self)
-        self.node_neighbors = {}     # Pairing: Node -> Neighbors
-        self.node_incidence = {}     # Pairing: Node -> Incident nodes
+        # node_neighbors and node_incidence both have a key for every node in the digraph; only
+        # node_neighbors is counted by order() and len()
+        self.node_neighbors = {}     # Pairing: Node -> (Neighbor -> Edge weight)
+        self.node_incidence = {}     # Pairing: Node -> Incident nodes (dict used as an ordered set)
         
 
     def nodes(self):
@@ -63,7 +69,7 @@ class digraph (basegraph, common, labeling):
         @rtype:  list
         @return: Node list.
         """
-        return list(self.node_neighbors.keys())
+        return list(self.node_neighbors)
 
 
     def neighbors(self, node):
@@ -76,7 +82,22 @@ class digraph (basegraph, common, labeling):
         @rtype:  list
         @return: List of nodes directly accessible from given node.
         """
-        return self.node_neighbors[node]
+        return list(self.node_neighbors[node])
+    
+    def neighbors_with_weights(self, node):
+        """
+        Return all nodes that are directly accessible from given node paired with the weights
+        of the edges reaching them.
+
+        @attention: The returned view reflects later changes to the graph.
+
+        @type  node: node
+        @param node: Node identifier
+
+        @rtype:  iterable
+        @return: View of (neighbor, weight) tuples.
+        """
+        return self.node_neighbors[node].items()
     
     
     def incidents(self, node):
@@ -89,7 +110,7 @@ class digraph (basegraph, common, labeling):
         @rtype:  list
         @return: List of nodes directly accessible from given node.    
         """
-        return self.node_incidence[node]
+        return list(self.node_incidence[node])
 
     def edges(self):
         """
@@ -133,13 +154,35 @@ class digraph (basegraph, common, labeling):
         if attrs is None:
             attrs = []
         if (node not in self.node_neighbors):
-            self.node_neighbors[node] = []
-            self.node_incidence[node] = []
+            self.node_neighbors[node] = {}
+            self.node_incidence[node] = {}
             self.node_attr[node] = attrs
         else:
             raise AdditionError("Node %s already in digraph" % node)
 
 
+    def add_nodes(self, nodelist):
+        """
+        Add given nodes to the graph.
+        
+        @attention: While nodes can be of any type, it's strongly recommended to use only
+        numbers and single-line strings as node identifiers if you intend to use write().
+        Objects used to identify nodes absolutely must be hashable. If you need attach a mutable
+        or non-hashable node, consider using the labeling feature.
+
+        @type  nodelist: list
+        @param nodelist: List of nodes to be added to the graph.
+        """
+        nodelist = list(nodelist)
+        if (len(set(nodelist)) != len(nodelist) or any(each in self.node_neighbors for each in nodelist)):
+            # Let add_node() raise AdditionError for the first repeated node
+            common.add_nodes(self, nodelist)
+            return
+        self.node_neighbors.update((each, {}) for each in nodelist)
+        self.node_incidence.update((each, {}) for each in nodelist)
+        self.node_attr.update((each, []) for each in nodelist)
+
+
     def add_edge(self, edge, wt = 1, label="", attrs = []):
         """
         Add an directed edge to the graph connecting two nodes.
@@ -168,11 +211,40 @@ class digraph (basegraph, common, labeling):
         if v in self.node_neighbors[u] and u in self.node_incidence[v]:
             raise AdditionError("Edge (%s, %s) already in digraph" % (u, v))
         else:
-            self.node_neighbors[u].append(v)
-            self.node_incidence[v].append(u)
-            self.set_edge_weight((u, v), wt)
+            self.node_neighbors[u][v] = wt
+            self.node_incidence[v][u] = None
             self.add_edge_attributes( (u, v), attrs )
-            self.set_edge_properties( (u, v), label=label, weight=wt )
+            # Labeling is lazy, so unlabeled edges don't need any storage besides adjacency
+            if (label != self.DEFAULT_LABEL):
+                self.set_edge_properties( (u, v), label=label )
+
+
+    def add_edges(self, edgelist):
+        """
+        Add given edges to the digraph.
+        
+        Each edge is given as a pair of nodes like C{(n, m)}, or as a triple C{(n, m, wt)} to set
+        its weight. Edges are added without labels or attributes, and faster than by calling
+        add_edge() for each one of them.
+
+        @type  edgelist: list
+        @param edgelist: List of edges to be added to the digraph.
+        """
+        node_neighbors = self.node_neighbors
+        node_incidence = self.node_incidence
+        for edge in edgelist:
+            if (len(edge) == 2):
+                u, v = edge
+                wt = self.DEFAULT_WEIGHT
+            else:
+                u, v, wt = edge
+            for n in (u, v):
+                if not n in node_neighbors:
+                    raise AdditionError( "%s is missing from the node_neighbors table" % n )
+            if v in node_neighbors[u]:
+                raise AdditionError("Edge (%s, %s) already in digraph" % (u, v))
+            node_neighbors[u][v] = wt
+            node_incidence[v][u] = None
 
 
     def del_node(self, node):
@@ -206,11 +278,28 @@ class digraph (basegraph, common, labeling):
         @param edge: Edge.
         """
         u, v = edge
-        self.node_neighbors[u].remove(v)
-        self.node_incidence[v].remove(u)
+        del(self.node_neighbors[u][v])
+        del(self.node_incidence[v][u])
         self.del_edge_labeling( (u,v) )
 
 
+    def del_edges(self, edgelist):
+        """
+        Remove given directed edges from the graph.
+        
+        @type  edgelist: list
+        @param edgelist: List of edges to be removed from the graph.
+        """
+        node_neighbors = self.node_neighbors
+        node_incidence = self.node_incidence
+        for u, v in edgelist:
+            del(node_neighbors[u][v])
+            del(node_incidence[v][u])
+            # Labeling is lazy, so there's often nothing else to remove
+            if (self.edge_properties or self.edge_attr):
+                self.del_edge_labeling( (u,v) )
+
+
     def has_edge(self, edge):
         """
         Return whether an edge exists.
@@ -222,7 +311,72 @@ class digraph (basegraph, common, labeling):
         @return: Truth-value for edge existence.
         """
         u, v = edge
-        return (u, v) in self.edge_properties
+        return v in self.node_neighbors.get(u, ())
+
+
+    def edge_weight(self, edge):
+        """
+        Get the weight of an edge.
+
+        @type  edge: edge
+        @param edge: One edge.
+        
+        @rtype:  number
+        @return: Edge weight.
+        """
+        u, v = edge
+        try:
+            return self.node_neighbors[u][v]
+        except KeyError:
+            return labeling.edge_weight(self, edge)
+
+
+    def set_edge_weight(self, edge, wt):
+        """
+        Set the weight of an edge.
+
+        @type  edge: edge
+        @param edge: One edge.
+
+        @type  wt: number
+        @param wt: Edge weight.
+        """
+        u, v = edge
+        if (v in self.node_neighbors.get(u, ())):
+            self.node_neighbors[u][v] = wt
+        else:
+            # Weights of edges not in the graph are kept among the edge properties
+            labeling.set_edge_properties(self, edge, weight=wt)
+
+
+    def set_edge_properties(self, edge, **properties):
+        # Weights are kept in the adjacency dictionaries, not among the edge properties
+        if (self.WEIGHT_ATTRIBUTE_NAME in properties):
+            self.set_edge_weight(edge, properties.pop(self.WEIGHT_ATTRIBUTE_NAME))
+        if (properties):
+            labeling.set_edge_properties(self, edge, **properties)
+
+
+    def get_edge_properties(self, edge):
+        """
+        Return the properties of an edge.
+        
+        @attention: The properties of an edge in the graph, which include its weight and label, are
+        returned as a copy. Use set_edge_properties() to change them.
+
+        @type  edge: edge
+        @param edge: One edge.
+        
+        @rtype:  dictionary
+        @return: Edge properties.
+        """
+        u, v = edge
+        if (v not in self.node_neighbors.get(u, ())):
+            return labeling.get_edge_properties(self, edge)
+        properties = {self.LABEL_ATTRIBUTE_NAME: self.DEFAULT_LABEL}
+        properties.update(self.edge_properties.get(self._edge_key(self.edge_properties, edge), {}))
+        properties[self.WEIGHT_ATTRIBUTE_NAME] = self.node_neighbors[u][v]
+        return properties
 
     
     def node_order(self, node):
@@ -232,7 +386,68 @@ class digraph (basegraph, common, labeling):
         @rtype:  number
         @return: Order of the given node.
         """
-        return len(self.neighbors(node))
+        return len(self.node_neighbors[node])
+
+    def order(self):
+        """
+        Return the order of self, this is defined as the number of nodes in the graph.
+
+        @rtype:  number
+        @return: Size of the graph.
+        """
+        return len(self.node_neighbors)
+
+    def __len__(self):
+        """
+        Return the order of self when requested by len().
+
+        @rtype:  number
+        @return: Size of the graph.
+        """
+        return len(self.node_neighbors)
+
+    def freeze(self, order=None):
+        """
+        Return a read-only snapshot of the graph in compressed sparse row form.
+        
+        @type  order: list
+        @param order: Optional list of all nodes in the order they should be numbered in the
+        snapshot.
+        
+        @rtype:  csr
+        @return: Snapshot of the graph.
+        """
+        return csr(self, order)
+
+    def __iter__(self):
+        """
+        Return a iterator passing through all nodes in the graph.
+        
+        @rtype:  iterator
+        @return: Iterator passing through all nodes in the graph.
+        """
+        return iter(list(self.node_neighbors))
+    
+    def iter_nodes(self):
+        """
+        Return a iterator passing through all nodes in the graph without copying them.
+        
+        @attention: Nodes must not be added or removed while the iterator is in use. Iterate
+        over the graph itself instead when that's needed.
+        
+        @rtype:  iterator
+        @return: Iterator passing through all nodes in the graph.
+        """
+        return iter(self.node_neighbors)
+    
+    def __getitem__(self, node):
+        """
+        Return a iterator passing through all neighbors of the given node.
+        
+        @rtype:  iterator
+        @return: Iterator passing through all neighbors of the given node.
+        """
+        return iter(list(self.node_neighbors[node]))
 
     def __eq__(self, other):
         """
@@ -32,6 +32,7 @@ Graph class
 
 # Imports
 from pygraph.classes.exceptions import AdditionError
+from pygraph.classes.csr import csr
 from pygraph.mixins.labeling import labeling
 from pygraph.mixins.common import common
 from pygraph.mixins.basegraph import basegraph
@@ -43,10 +44,13 @@ class graph(basegraph, common, labeling):
     
     Graphs are built of nodes and edges.
 
-    @sort:  __eq__, __init__, __ne__, add_edge, add_node, del_edge, del_node, edges, has_edge, has_node,
-    neighbors, node_order, nodes
+    @sort:  __eq__, __getitem__, __init__, __iter__, __len__, __ne__, add_edge, add_edges, add_node, add_nodes, del_edge, del_edges, del_node, edges, freeze, get_edge_properties, has_edge, has_node, iter_nodes,
+    neighbors, neighbors_with_weights, node_order, nodes, order
     """
     
+    # __dict__ keeps user attributes such as name, used by the dot writer
+    __slots__ = ('node_neighbors', '__dict__', '__weakref__')
+    
     DIRECTED = False
 
 
@@ -56,7 +60,9 @@ class graph(basegraph, common, labeling):
         """
         common.__init__(self)
         labeling.__init__(self)
-        self.node_neighbors = {}     # Pairing: Node -> Neighbors
+        # node_neighbors has a key for every node in the graph, so it's the only container counted
+        # by order() and len()
+        self.node_neighbors = {}     # Pairing: Node -> (Neighbor -> Edge weight)
     
     def nodes(self):
         """
@@ -65,7 +71,7 @@ class graph(basegraph, common, labeling):
         @rtype:  list
         @return: Node list.
         """
-        return list(self.node_neighbors.keys())
+        return list(self.node_neighbors)
 
 
     def neighbors(self, node):
@@ -78,7 +84,22 @@ class graph(basegraph, common, labeling):
         @rtype:  list
         @return: List of nodes directly accessible from given node.
         """
-        return self.node_neighbors[node]
+        return list(self.node_neighbors[node])
+    
+    def neighbors_with_weights(self, node):
+        """
+        Return all nodes that are directly accessible from given node paired with the weights
+        of the edges reaching them.
+
+        @attention: The returned view reflects later changes to the graph.
+
+        @type  node: node
+        @param node: Node identifier
+
+        @rtype:  iterable
+        @return: View of (neighbor, weight) tuples.
+        """
+        return self.node_neighbors[node].items()
     
     def edges(self):
         """
@@ -87,7 +108,7 @@ class graph(basegraph, common, labeling):
         @rtype:  list
         @return: List of all edges in the graph.
         """
-        return [ a for a in self.edge_properties.keys() ]
+        return [ (u, v) for u, neighbors in self.node_neighbors.items() for v in neighbors ]
 
     def has_node(self, node):
         """
@@ -118,11 +139,31 @@ class graph(basegraph, common, labeling):
         if attrs is None:
             attrs = []
         if (not node in self.node_neighbors):
-            self.node_neighbors[node] = []
+            self.node_neighbors[node] = {}
             self.node_attr[node] = attrs
         else:
             raise AdditionError("Node %s already in graph" % node)
 
+    def add_nodes(self, nodelist):
+        """
+        Add given nodes to the graph.
+        
+        @attention: While nodes can be of any type, it's strongly recommended to use only
+        numbers and single-line strings as node identifiers if you intend to use write().
+        Objects used to identify nodes absolutely must be hashable. If you need attach a mutable
+        or non-hashable node, consider using the labeling feature.
+
+        @type  nodelist: list
+        @param nodelist: List of nodes to be added to the graph.
+        """
+        nodelist = list(nodelist)
+        if (len(set(nodelist)) != len(nodelist) or any(each in self.node_neighbors for each in nodelist)):
+            # Let add_node() raise AdditionError for the first repeated node
+            common.add_nodes(self, nodelist)
+            return
+        self.node_neighbors.update((each, {}) for each in nodelist)
+        self.node_attr.update((each, []) for each in nodelist)
+
     def add_edge(self, edge, wt=1, label='', attrs=[]):
         """
         Add an edge to the graph connecting two nodes.
@@ -143,16 +184,44 @@ class graph(basegraph, common, labeling):
         """
         u, v = edge
         if (v not in self.node_neighbors[u] and u not in self.node_neighbors[v]):
-            self.node_neighbors[u].append(v)
+            self.node_neighbors[u][v] = wt
             if (u != v):
-                self.node_neighbors[v].append(u)
+                self.node_neighbors[v][u] = wt
                 
             self.add_edge_attributes((u,v), attrs)        
-            self.set_edge_properties((u, v), label=label, weight=wt)
+            # Labeling is lazy, so unlabeled edges don't need any storage besides adjacency
+            if (label != self.DEFAULT_LABEL):
+                self.set_edge_properties((u, v), label=label)
         else:
             raise AdditionError("Edge (%s, %s) already in graph" % (u, v))
 
 
+    def add_edges(self, edgelist):
+        """
+        Add given edges to the graph.
+        
+        Each edge is given as a pair of nodes like C{(n, m)}, or as a triple C{(n, m, wt)} to set
+        its weight. Edges are added without labels or attributes, and faster than by calling
+        add_edge() for each one of them.
+
+        @type  edgelist: list
+        @param edgelist: List of edges to be added to the graph.
+        """
+        node_neighbors = self.node_neighbors
+        for edge in edgelist:
+            if (len(edge) == 2):
+                u, v = edge
+                wt = self.DEFAULT_WEIGHT
+            else:
+                u, v, wt = edge
+            u_neighbors = node_neighbors[u]
+            v_neighbors = node_neighbors[v]
+            if (v in u_neighbors or u in v_neighbors):
+                raise AdditionError("Edge (%s, %s) already in graph" % (u, v))
+            u_neighbors[v] = wt
+            v_neighbors[u] = wt
+
+
     def del_node(self, node):
         """
         Remove a node from the graph.
@@ -175,15 +244,36 @@ class graph(basegraph, common, labeling):
         @param edge: Edge.
         """
         u, v = edge
-        self.node_neighbors[u].remove(v)
-        self.del_edge_labeling((u, v))  
+        del(self.node_neighbors[u][v])
         if (u != v):
-            self.node_neighbors[v].remove(u)
-            self.del_edge_labeling((v, u)) # TODO: This is redundant
+            del(self.node_neighbors[v][u])
+        # Removes the labeling of both arrows
+        self.del_edge_labeling((u, v))
+
+
+    def del_edges(self, edgelist):
+        """
+        Remove given edges from the graph.
+        
+        @type  edgelist: list
+        @param edgelist: List of edges to be removed from the graph.
+        """
+        node_neighbors = self.node_neighbors
+        for u, v in edgelist:
+            del(node_neighbors[u][v])
+            if (u != v):
+                del(node_neighbors[v][u])
+            # Labeling is lazy, so there's often nothing else to remove
+            if (self.edge_properties or self.edge_attr):
+                self.del_edge_labeling((u, v))
 
     def has_edge(self, edge):
         """
         Return whether an edge exists.
+        
+        @attention: add_edge() and del_edge() always insert and remove both arrows (u, v) and
+        (v, u) together, so looking up a single direction is enough. Code mutating
+        C{node_neighbors} directly must preserve this invariant.
 
         @type  edge: tuple
         @param edge: Edge.
@@ -192,8 +282,74 @@ class graph(basegraph, common, labeling):
         @return: Truth-value for edge existence.
         """
         u,v = edge
-        return (u,v) in self.edge_properties and (v,u) in self.edge_properties
+        return v in self.node_neighbors.get(u, ())
+    
     
+    def edge_weight(self, edge):
+        """
+        Get the weight of an edge.
+
+        @type  edge: edge
+        @param edge: One edge.
+        
+        @rtype:  number
+        @return: Edge weight.
+        """
+        u, v = edge
+        try:
+            return self.node_neighbors[u][v]
+        except KeyError:
+            return labeling.edge_weight(self, edge)
+
+
+    def set_edge_weight(self, edge, wt):
+        """
+        Set the weight of an edge.
+
+        @type  edge: edge
+        @param edge: One edge.
+
+        @type  wt: number
+        @param wt: Edge weight.
+        """
+        u, v = edge
+        if (v in self.node_neighbors.get(u, ())):
+            self.node_neighbors[u][v] = wt
+            self.node_neighbors[v][u] = wt
+        else:
+            # Weights of edges not in the graph are kept among the edge properties
+            labeling.set_edge_properties(self, edge, weight=wt)
+
+
+    def set_edge_properties(self, edge, **properties):
+        # Weights are kept in the adjacency dictionaries, not among the edge properties
+        if (self.WEIGHT_ATTRIBUTE_NAME in properties):
+            self.set_edge_weight(edge, properties.pop(self.WEIGHT_ATTRIBUTE_NAME))
+        if (properties):
+            labeling.set_edge_properties(self, edge, **properties)
+
+
+    def get_edge_properties(self, edge):
+        """
+        Return the properties of an edge.
+        
+        @attention: The properties of an edge in the graph, which include its weight and label, are
+        returned as a copy. Use set_edge_properties() to change them.
+
+        @type  edge: edge
+        @param edge: One edge.
+        
+        @rtype:  dictionary
+        @return: Edge properties.
+        """
+        u, v = edge
+        if (v not in self.node_neighbors.get(u, ())):
+            return labeling.get_edge_properties(self, edge)
+        properties = {self.LABEL_ATTRIBUTE_NAME: self.DEFAULT_LABEL}
+        properties.update(self.edge_properties.get(self._edge_key(self.edge_properties, edge), {}))
+        properties[self.WEIGHT_ATTRIBUTE_NAME] = self.node_neighbors[u][v]
+        return properties
+
     
     def node_order(self, node):
         """
@@ -202,8 +358,70 @@ class graph(basegraph, common, labeling):
         @rtype:  number
         @return: Order of the given node.
         """
-        return len(self.neighbors(node))
+        return len(self.node_neighbors[node])
 
+    def order(self):
+        """
+        Return the order of self, this is defined as the number of nodes in the graph.
+
+        @rtype:  number
+        @return: Size of the graph.
+        """
+        return len(self.node_neighbors)
+
+    def __len__(self):
+        """
+        Return the order of self when requested by len().
+
+        @rtype:  number
+        @return: Size of the graph.
+        """
+        return len(self.node_neighbors)
+
+
+    def freeze(self, order=None):
+        """
+        Return a read-only snapshot of the graph in compressed sparse row form.
+        
+        @type  order: list
+        @param order: Optional list of all nodes in the order they should be numbered in the
+        snapshot.
+        
+        @rtype:  csr
+        @return: Snapshot of the graph.
+        """
+        return csr(self, order)
+
+
+    def __iter__(self):
+        """
+        Return a iterator passing through all nodes in the graph.
+        
+        @rtype:  iterator
+        @return: Iterator passing through all nodes in the graph.
+        """
+        return iter(list(self.node_neighbors))
+    
+    def iter_nodes(self):
+        """
+        Return a iterator passing through all nodes in the graph without copying them.
+        
+        @attention: Nodes must not be added or removed while the iterator is in use. Iterate
+        over the graph itself instead when that's needed.
+        
+        @rtype:  iterator
+        @return: Iterator passing through all nodes in the graph.
+        """
+        return iter(self.node_neighbors)
+    
+    def __getitem__(self, node):
+        """
+        Return a iterator passing through all neighbors of the given node.
+        
+        @rtype:  iterator
+        @return: Iterator passing through all neighbors of the given node.
+        """
+        return iter(list(self.node_neighbors[node]))
 
     def __eq__(self, other):
         """
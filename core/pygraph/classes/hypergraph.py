@@ -48,6 +48,9 @@ class hypergraph (basegraph, common, labeling):
     del_edge, has_node, has_edge, has_hyperedge, hyperedges, link, links, nodes, unlink
     """
 
+    # __dict__ keeps user attributes such as name, used by the dot writer
+    __slots__ = ('node_links', 'edge_links', 'graph', '__dict__', '__weakref__')
+    
     # Technically this isn't directed, but it gives us the right
     #  behaviour with the parent classes.
     DIRECTED = True
@@ -70,7 +73,7 @@ class hypergraph (basegraph, common, labeling):
         @rtype:  list
         @return: Node list.
         """
-        return list(self.node_links.keys())
+        return list(self.node_links)
 
 
     def edges(self):
@@ -83,6 +86,16 @@ class hypergraph (basegraph, common, labeling):
         return self.hyperedges()
 
 
+    def _edge_count(self):
+        """
+        Return the number of hyperedges, without building the hyperedge list.
+        
+        @rtype:  number
+        @return: Number of hyperedges.
+        """
+        return len(self.edge_links)
+
+
     def hyperedges(self):
         """
         Return hyperedge list.
@@ -90,7 +103,7 @@ class hypergraph (basegraph, common, labeling):
         @rtype:  list
         @return: List of hyperedges in the graph.
         """
-        return list(self.edge_links.keys())
+        return list(self.edge_links)
     
     
     def has_edge(self, hyperedge):
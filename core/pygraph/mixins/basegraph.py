@@ -29,4 +29,5 @@ class basegraph( object ):
     to test isinstance(X, basegraph) to determine if the object is one of any of the python-graph
     main classes.
     """
-    
\ No newline at end of file
+    
+    __slots__ = ()
@@ -28,19 +28,44 @@ class common( object ):
     Standard methods common to all graph classes.
     
     @sort: __eq__, __getitem__, __iter__, __len__, __repr__, __str__, add_graph, add_nodes,
-    add_spanning_tree, complete, inverse, order, reverse
+    add_spanning_tree, complete, inverse, iter_nodes, order, reverse
     """
     
+    __slots__ = ()
+    
+    # Largest number of nodes or edges listed by str(); bigger graphs only show their sizes
+    STR_MAX_ITEMS = 32
+    
     def __str__(self):
         """
         Return a string representing the graph when requested by str() (or print).
+        
+        Node and edge lists longer than C{STR_MAX_ITEMS} are summarized by their length.
 
         @rtype:  string
         @return: String representing the graph.
         """
-        str_nodes = repr( self.nodes() )
-        str_edges = repr( self.edges() )
+        # Lists are only built when they're short enough to be shown
+        node_count = len(self)
+        edge_count = self._edge_count()
+        if (node_count > self.STR_MAX_ITEMS):
+            str_nodes = "[...%d nodes...]" % node_count
+        else:
+            str_nodes = repr( self.nodes() )
+        if (edge_count > self.STR_MAX_ITEMS):
+            str_edges = "[...%d edges...]" % edge_count
+        else:
+            str_edges = repr( self.edges() )
         return "%s %s" % ( str_nodes, str_edges )
+    
+    def _edge_count(self):
+        """
+        Return the number of items listed by edges(), without building the list.
+        
+        @rtype:  number
+        @return: Number of edges.
+        """
+        return sum(self.node_order(node) for node in self.iter_nodes())
 
     def __repr__(self):
         """
@@ -60,6 +85,16 @@ class common( object ):
         """
         for n in self.nodes():
             yield n
+    
+    def iter_nodes(self):
+        """
+        Return a iterator passing through all nodes in the graph, for callers that don't change
+        the graph while iterating.
+        
+        @rtype:  iterator
+        @return: Iterator passing through all nodes in the graph.
+        """
+        return iter(self.nodes())
             
     def __len__(self):
         """
@@ -113,9 +148,9 @@ class common( object ):
         @type  other: graph
         @param other: Graph
         """
-        self.add_nodes( n for n in other.nodes() if not n in self.nodes() )
+        self.add_nodes( n for n in other.iter_nodes() if not self.has_node(n) )
         
-        for each_node in other.nodes():
+        for each_node in other.iter_nodes():
             for each_edge in other.neighbors(each_node):
                 if (not self.has_edge((each_node, each_edge))):
                     self.add_edge((each_node, each_edge))
@@ -128,7 +163,7 @@ class common( object ):
         @type  st: dictionary
         @param st: Spanning tree.
         """
-        self.add_nodes(list(st.keys()))
+        self.add_nodes(list(st))
         for each in st:
             if (st[each] is not None):
                 self.add_edge((st[each], each))
@@ -140,8 +175,8 @@ class common( object ):
         
         @attention: This will modify the current graph.
         """
-        for each in self.nodes():
-            for other in self.nodes():
+        for each in self.iter_nodes():
+            for other in self.iter_nodes():
                 if (each != other and not self.has_edge((each, other))):
                     self.add_edge((each, other))
 
@@ -196,9 +231,9 @@ class common( object ):
         """
         
         def nodes_eq():
-            for each in self:
+            for each in self.iter_nodes():
                 if (not other.has_node(each)): return False
-            for each in other:
+            for each in other.iter_nodes():
                 if (not self.has_node(each)): return False
             return True
         
@@ -31,6 +31,9 @@ class labeling( object ):
     del_edge_labeling, del_node_labeling, edge_attributes, edge_label, edge_weight,
     get_edge_properties, node_attributes, set_edge_label, set_edge_properties, set_edge_weight 
     """
+    
+    __slots__ = ('edge_properties', 'edge_attr', 'node_attr')
+    
     WEIGHT_ATTRIBUTE_NAME = "weight"
     DEFAULT_WEIGHT = 1
     
@@ -39,6 +42,7 @@ class labeling( object ):
     
     def __init__(self):
         # Metadata bout edges
+        # Undirected edges are stored under a single key, (u, v) or (v, u), see _edge_key()
         self.edge_properties = {}    # Mapping: Edge -> Dict mapping, lablel-> str, wt->num
         self.edge_attr = {}          # Key value pairs: (Edge -> Attributes)
         
@@ -63,6 +67,29 @@ class labeling( object ):
                 except KeyError:
                     pass
     
+    def _edge_key(self, mapping, edge):
+        """
+        Return the key under which the given edge is stored in the given edge mapping.
+        
+        Both arrows of an undirected edge share the same labeling, so it's stored only once,
+        under the arrow it was first labeled through. Lookups through the other arrow find it
+        under the reversed key.
+        
+        @type  mapping: dictionary
+        @param mapping: Edge mapping (edge_properties or edge_attr).
+        
+        @type  edge: edge
+        @param edge: One edge.
+        
+        @rtype:  edge
+        @return: Key for the given edge.
+        """
+        if (not self.DIRECTED and edge not in mapping):
+            reverse = (edge[1], edge[0])
+            if (reverse in mapping):
+                return reverse
+        return edge
+    
     def edge_weight(self, edge):
         """
         Get the weight of an edge.
@@ -73,7 +100,8 @@ class labeling( object ):
         @rtype:  number
         @return: Edge weight.
         """
-        return self.get_edge_properties( edge ).setdefault( self.WEIGHT_ATTRIBUTE_NAME, self.DEFAULT_WEIGHT )
+        properties = self.edge_properties.get( self._edge_key( self.edge_properties, edge ), {} )
+        return properties.get( self.WEIGHT_ATTRIBUTE_NAME, self.DEFAULT_WEIGHT )
 
 
     def set_edge_weight(self, edge, wt):
@@ -87,8 +115,6 @@ class labeling( object ):
         @param wt: Edge weight.
         """
         self.set_edge_properties(edge, weight=wt )
-        if not self.DIRECTED:
-            self.set_edge_properties((edge[1], edge[0]) , weight=wt )
 
 
     def edge_label(self, edge):
@@ -101,7 +127,8 @@ class labeling( object ):
         @rtype:  string
         @return: Edge label
         """
-        return self.get_edge_properties( edge ).setdefault( self.LABEL_ATTRIBUTE_NAME, self.DEFAULT_LABEL )
+        properties = self.edge_properties.get( self._edge_key( self.edge_properties, edge ), {} )
+        return properties.get( self.LABEL_ATTRIBUTE_NAME, self.DEFAULT_LABEL )
 
     def set_edge_label(self, edge, label):
         """
@@ -114,16 +141,13 @@ class labeling( object ):
         @param label: Edge label.
         """
         self.set_edge_properties(edge, label=label )
-        if not self.DIRECTED:
-            self.set_edge_properties((edge[1], edge[0]) , label=label )
             
     def set_edge_properties(self, edge, **properties ):
-        self.edge_properties.setdefault( edge, {} ).update( properties )
-        if (not self.DIRECTED and edge[0] != edge[1]):
-            self.edge_properties.setdefault((edge[1], edge[0]), {}).update( properties )
+        key = self._edge_key( self.edge_properties, edge )
+        self.edge_properties.setdefault( key, {} ).update( properties )
         
     def get_edge_properties(self, edge):
-        return self.edge_properties.setdefault( edge, {} )
+        return self.edge_properties.setdefault( self._edge_key( self.edge_properties, edge ), {} )
             
     def add_edge_attribute(self, edge, attr):
         """
@@ -135,10 +159,8 @@ class labeling( object ):
         @type  attr: tuple
         @param attr: Node attribute specified as a tuple in the form (attribute, value).
         """
-        self.edge_attr[edge] = self.edge_attributes(edge) + [attr]
-        
-        if (not self.DIRECTED and edge[0] != edge[1]):
-            self.edge_attr[(edge[1],edge[0])] = self.edge_attributes((edge[1], edge[0])) + [attr]
+        key = self._edge_key( self.edge_attr, edge )
+        self.edge_attr[key] = self.edge_attributes(key) + [attr]
     
     def add_edge_attributes(self, edge, attrs):
         """
@@ -191,7 +213,7 @@ class labeling( object ):
         @return: List of attributes specified tuples in the form (attribute, value).
         """
         try:
-            return self.edge_attr[edge]
+            return self.edge_attr[self._edge_key( self.edge_attr, edge )]
         except KeyError:
             return []
 
@@ -220,7 +242,7 @@ class labeling( object ):
             return True
         
         def nodes_eq():
-            for node in self:
+            for node in self.iter_nodes():
                 if (not attrs_eq(self.node_attributes(node), other.node_attributes(node))): return False 
             return True
         
@@ -83,13 +83,13 @@ def read(string):
             G.add_node(each_edge.get_destination())
         
         # See if there's a weight
-        if 'weight' in each_edge.get_attributes().keys():
+        if 'weight' in each_edge.get_attributes():
             _wt = each_edge.get_attributes()['weight']
         else:
             _wt = 1
         
         # See if there is a label
-        if 'label' in each_edge.get_attributes().keys():
+        if 'label' in each_edge.get_attributes():
             _label = each_edge.get_attributes()['label']
         else:
             _label = ''
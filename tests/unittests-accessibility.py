@@ -93,6 +93,30 @@ class test_accessibility(unittest.TestCase):
         accessibility(gr)
         assert getrecursionlimit() == recursionlimit
 
+    def test_accessibility_on_frozen_graph(self):
+        gr = testlib.new_graph()
+        ac = accessibility(gr)
+        fac = accessibility(gr.freeze())
+        for n in gr:
+            assert sorted(fac[n]) == sorted(ac[n])
+    
+    def test_accessibility_on_frozen_digraph(self):
+        gr = testlib.new_digraph()
+        ac = accessibility(gr)
+        fac = accessibility(gr.freeze())
+        for n in gr:
+            assert sorted(fac[n]) == sorted(ac[n])
+    
+    def test_accessibility_on_very_deep_frozen_digraph(self):
+        gr = pygraph.classes.digraph.digraph()
+        gr.add_nodes(range(0,2001))
+        for i in range(0,2000):
+            gr.add_edge((i,i+1))
+        gr.add_edge((2000,1000))
+        ac = accessibility(gr.freeze())
+        assert ac[0] == list(range(0,2001))
+        assert ac[1500] == list(range(1000,2001))
+
     def test_mutual_accessibility_in_graph(self):
         gr = testlib.new_graph()
         gr.add_nodes(['a','b','c'])
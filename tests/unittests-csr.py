@@ -0,0 +1,147 @@
+# Copyright (c) Pedro Matiello <pmatiello@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+
+"""
+Unittests for graph.classes.csr
+"""
+
+
+import unittest
+import pygraph
+from pygraph.classes.graph import graph
+from pygraph.classes.digraph import digraph
+from pygraph.classes.csr import csr
+from pygraph.algorithms.searching import breadth_first_search
+from pygraph.algorithms.minmax import shortest_path
+from fractions import Fraction
+import testlib
+
+class test_csr(unittest.TestCase):
+
+    def test_freeze_empty_graph(self):
+        gr = graph().freeze()
+        assert isinstance(gr, csr)
+        assert gr.nodes() == []
+        assert gr.edges() == []
+        assert list(gr.indptr) == [0]
+    
+    def test_freeze_graph(self):
+        gr = testlib.new_graph(wt_range=(1, 10))
+        fr = gr.freeze()
+        assert fr.nodes() == gr.nodes()
+        assert sorted(fr.edges()) == sorted(gr.edges())
+        for each in gr:
+            assert fr.neighbors(each) == gr.neighbors(each)
+            assert fr.node_order(each) == gr.node_order(each)
+            assert fr.neighbors_with_weights(each) == list(gr.neighbors_with_weights(each))
+        for each in gr.edges():
+            assert fr.has_edge(each)
+            assert fr.edge_weight(each) == gr.edge_weight(each)
+    
+    def test_freeze_digraph(self):
+        gr = testlib.new_digraph(wt_range=(1, 10))
+        fr = gr.freeze()
+        assert fr.DIRECTED
+        assert sorted(fr.edges()) == sorted(gr.edges())
+        for each in gr.edges():
+            assert fr.edge_weight(each) == gr.edge_weight(each)
+    
+    def test_csr_layout(self):
+        gr = digraph()
+        gr.add_nodes(['a', 'b', 'c'])
+        gr.add_edge(('a', 'b'), wt=2)
+        gr.add_edge(('a', 'c'), wt=3)
+        gr.add_edge(('c', 'a'), wt=4)
+        fr = gr.freeze()
+        assert fr.node_list == ['a', 'b', 'c']
+        assert list(fr.indptr) == [0, 2, 2, 3]
+        assert list(fr.indices) == [1, 2, 0]
+        assert list(fr.weights) == [2, 3, 4]
+        assert list(fr.degrees()) == [2, 0, 1]
+        assert not fr.has_edge(('b', 'a'))
+        assert not fr.has_edge(('a', 'd'))
+    
+    def test_weights_are_kept_exactly(self):
+        gr = digraph()
+        gr.add_nodes([0, 1, 2])
+        gr.add_edge((0, 1), wt=2**70)
+        gr.add_edge((1, 2), wt=1)
+        fr = gr.freeze()
+        assert fr.edge_weight((0, 1)) == 2**70
+        assert shortest_path(fr, 0)[1] == shortest_path(gr, 0)[1]
+        
+        gr.set_edge_weight((0, 1), Fraction(1, 3))
+        gr.set_edge_weight((1, 2), Fraction(2, 3))
+        fr = gr.freeze()
+        assert fr.edge_weight((0, 1)) == Fraction(1, 3)
+        assert shortest_path(fr, 0)[1] == shortest_path(gr, 0)[1]
+        
+        gr.set_edge_weight((0, 1), 0.5)
+        gr.set_edge_weight((1, 2), 1.5)
+        assert gr.freeze().weights.typecode == 'd'
+    
+    def test_freeze_graph_with_non_numeric_weights(self):
+        gr = graph()
+        gr.add_nodes([0, 1, 2])
+        gr.add_edge((0, 1), wt=None)
+        gr.add_edge((1, 2), wt=None)
+        fr = gr.freeze()
+        assert fr.edge_weight((0, 1)) is None
+        assert breadth_first_search(fr, 0)[1] == breadth_first_search(gr, 0)[1]
+    
+    def test_reorder(self):
+        gr = testlib.new_graph(wt_range=(1, 10))
+        order = gr.nodes()
+        order.reverse()
+        fr = gr.freeze().reorder(order)
+        assert fr.node_list == order
+        assert sorted(fr.edges()) == sorted(gr.edges())
+        for each in gr.edges():
+            assert fr.edge_weight(each) == gr.edge_weight(each)
+        assert gr.freeze(order).edges() == fr.edges()
+    
+    def test_reorder_with_incomplete_order(self):
+        fr = testlib.new_graph().freeze()
+        try:
+            fr.reorder(fr.nodes()[1:])
+        except ValueError:
+            pass
+        else:
+            fail()
+        try:
+            fr.reorder(fr.nodes()[1:] + ['x'])
+        except ValueError:
+            pass
+        else:
+            fail()
+    
+    def test_snapshot_is_not_updated(self):
+        gr = graph()
+        gr.add_nodes([0, 1])
+        fr = gr.freeze()
+        gr.add_edge((0, 1))
+        assert fr.edges() == []
+        
+if __name__ == "__main__":
+    unittest.main()
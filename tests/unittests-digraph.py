@@ -50,6 +50,47 @@ class test_digraph(unittest.TestCase):
         else:
             fail()
 
+    def test_raise_exception_on_duplicate_node_addition_in_batch(self):
+        gr = digraph()
+        gr.add_node(2)
+        try:
+            gr.add_nodes([0, 1, 2, 3])
+        except AdditionError:
+            pass
+        else:
+            fail()
+        assert gr.nodes() == [2, 0, 1]
+        try:
+            gr.add_nodes([4, 4])
+        except AdditionError:
+            pass
+        else:
+            fail()
+        assert gr.nodes() == [2, 0, 1, 4]
+    
+    def test_add_nodes(self):
+        gr = digraph()
+        gr.add_nodes(range(5))
+        gr.add_nodes(each for each in range(5, 10))
+        assert gr.nodes() == list(range(10))
+        assert gr.node_attributes(9) == []
+
+    def test_add_edges(self):
+        gr = digraph()
+        gr.add_nodes([0, 1, 2])
+        gr.add_edges([(0, 1), (0, 2, 5), (2, 0, 5)])
+        assert sorted(gr.edges()) == [(0, 1), (0, 2), (2, 0)]
+        assert gr.edge_weight((0, 1)) == 1
+        assert gr.edge_weight((0, 2)) == 5
+        assert gr.has_edge((2, 0))
+        try:
+            gr.add_edges([(1, 2), (0, 1)])
+        except AdditionError:
+            pass
+        else:
+            fail()
+        assert gr.has_edge((1, 2))
+    
     def test_raise_exception_on_duplicate_edge_addition(self):
         gr = digraph()
         gr.add_node('a_node')
@@ -71,8 +112,8 @@ class test_digraph(unittest.TestCase):
             pass
         else:
             self.fail("The graph allowed an edge to be added from a non-existing node.")
-        assert gr.node_neighbors == {0: [], 1: []}
-        assert gr.node_incidence == {0: [], 1: []}
+        assert gr.node_neighbors == {0: {}, 1: {}}
+        assert gr.node_incidence == {0: {}, 1: {}}
     
     def test_raise_exception_when_edge_added_to_non_existing_node(self):
         gr = digraph()
@@ -83,8 +124,8 @@ class test_digraph(unittest.TestCase):
             pass
         else:
             self.fail("TThe graph allowed an edge to be added to a non-existing node.")
-        assert gr.node_neighbors == {0: [], 1: []}
-        assert gr.node_incidence == {0: [], 1: []}
+        assert gr.node_neighbors == {0: {}, 1: {}}
+        assert gr.node_incidence == {0: {}, 1: {}}
     
     def test_remove_node(self):
         gr = testlib.new_digraph()
@@ -94,6 +135,18 @@ class test_digraph(unittest.TestCase):
             self.assertTrue(each in gr)
             self.assertTrue(other in gr)
     
+    def test_remove_edges(self):
+        gr = testlib.new_digraph()
+        edges = gr.edges()
+        gr.add_node('n')
+        gr.add_edge(('n', 0), label='l', attrs=[('key','value')])
+        gr.del_edges(edges[::2] + [('n', 0)])
+        assert sorted(gr.edges()) == sorted(edges[1::2])
+        for each in edges[::2]:
+            assert not gr.has_edge(each)
+        assert gr.edge_label(('n', 0)) == ''
+        assert gr.edge_attributes(('n', 0)) == []
+    
     def test_remove_edge_from_node_to_same_node(self):
         gr = digraph()
         gr.add_node(0)
@@ -105,6 +158,50 @@ class test_digraph(unittest.TestCase):
         gr.add_node(0)
         gr.add_edge((0, 0))
         gr.del_node(0)
+    
+    def test_edge_weight_is_stored_for_one_arrow(self):
+        gr = digraph()
+        gr.add_nodes([0,1])
+        gr.add_edge((0,1), wt=5)
+        gr.add_edge((1,0))
+        gr.set_edge_weight((1,0), 7)
+        assert gr.edge_weight((0,1)) == 5
+        assert gr.edge_weight((1,0)) == 7
+        assert gr.node_neighbors == {0: {1: 5}, 1: {0: 7}}
+    
+    def test_edge_properties_include_weight(self):
+        gr = digraph()
+        gr.add_nodes([0,1])
+        gr.add_edge((0,1), wt=3, label="l")
+        assert gr.get_edge_properties((0,1)) == {"weight": 3, "label": "l"}
+        assert gr.edge_weight((1,0)) == 1
+    
+    def test_weight_of_edge_not_in_digraph_is_stored(self):
+        gr = digraph()
+        gr.add_nodes([0,1])
+        gr.set_edge_weight((0,1), 5)
+        assert gr.edge_weight((0,1)) == 5
+        assert gr.edge_weight((1,0)) == 1
+        assert not gr.has_edge((0,1))
+    
+    def test_change_graph_while_iterating(self):
+        gr = testlib.new_digraph()
+        assert list(gr.iter_nodes()) == gr.nodes()
+        for each in gr:
+            for other in gr[each]:
+                gr.del_edge((each, other))
+        assert gr.edges() == []
+        for each in gr:
+            gr.del_node(each)
+        assert gr.nodes() == []
+    
+    def test_neighbors_with_weights(self):
+        gr = testlib.new_digraph(wt_range=(1,10))
+        for each in gr:
+            pairs = list(gr.neighbors_with_weights(each))
+            assert [v for v, w in pairs] == gr.neighbors(each)
+            for v, w in pairs:
+                assert w == gr.edge_weight((each, v))
 
     
     # Invert graph
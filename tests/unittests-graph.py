@@ -34,6 +34,7 @@ from pygraph.classes.exceptions import AdditionError
 from pygraph.classes.graph import graph
 import testlib
 from copy import copy, deepcopy
+import weakref
 
 class test_graph(unittest.TestCase):
 
@@ -49,6 +50,47 @@ class test_graph(unittest.TestCase):
         else:
             fail()
 
+    def test_raise_exception_on_duplicate_node_addition_in_batch(self):
+        gr = graph()
+        gr.add_node(2)
+        try:
+            gr.add_nodes([0, 1, 2, 3])
+        except AdditionError:
+            pass
+        else:
+            fail()
+        assert gr.nodes() == [2, 0, 1]
+        try:
+            gr.add_nodes([4, 4])
+        except AdditionError:
+            pass
+        else:
+            fail()
+        assert gr.nodes() == [2, 0, 1, 4]
+    
+    def test_add_nodes(self):
+        gr = graph()
+        gr.add_nodes(range(5))
+        gr.add_nodes(each for each in range(5, 10))
+        assert gr.nodes() == list(range(10))
+        assert gr.node_attributes(9) == []
+
+    def test_add_edges(self):
+        gr = graph()
+        gr.add_nodes([0, 1, 2])
+        gr.add_edges([(0, 1), (0, 2, 5)])
+        assert sorted(gr.edges()) == [(0, 1), (0, 2), (1, 0), (2, 0)]
+        assert gr.edge_weight((0, 1)) == 1
+        assert gr.edge_weight((0, 2)) == 5
+        assert gr.has_edge((2, 0))
+        try:
+            gr.add_edges([(1, 2), (0, 1)])
+        except AdditionError:
+            pass
+        else:
+            fail()
+        assert gr.has_edge((1, 2))
+    
     def test_raise_exception_on_duplicate_edge_addition(self):
         gr = graph()
         gr.add_node('a_node')
@@ -70,7 +112,7 @@ class test_graph(unittest.TestCase):
             pass
         else:
             fail()
-        assert gr.node_neighbors == {0: [], 1: []}
+        assert gr.node_neighbors == {0: {}, 1: {}}
     
     def test_raise_exception_when_edge_added_to_non_existing_node(self):
         gr = graph()
@@ -81,7 +123,7 @@ class test_graph(unittest.TestCase):
             pass
         else:
             fail()
-        assert gr.node_neighbors == {0: [], 1: []}
+        assert gr.node_neighbors == {0: {}, 1: {}}
     
     def test_remove_node(self):
         gr = testlib.new_graph()
@@ -91,6 +133,17 @@ class test_graph(unittest.TestCase):
             self.assertTrue(each in gr)
             self.assertTrue(other in gr)
     
+    def test_remove_edges(self):
+        gr = graph()
+        gr.add_nodes([0, 1, 2, 3])
+        gr.add_edges([(0, 1), (1, 2), (2, 3), (3, 3)])
+        gr.add_edge((0, 3), label='l', attrs=[('key','value')])
+        gr.del_edges([(1, 0), (3, 2), (3, 3), (0, 3)])
+        assert sorted(gr.edges()) == [(1, 2), (2, 1)]
+        assert gr.edge_label((3, 0)) == ''
+        assert gr.edge_attributes((0, 3)) == []
+        assert gr.edge_properties == {}
+    
     def test_remove_edge_from_node_to_same_node(self):
         gr = graph()
         gr.add_node(0)
@@ -112,10 +165,15 @@ class test_graph(unittest.TestCase):
         assert len(gr.edges()) == 2
         assert gr.neighbors(0) == [1]
         assert gr.neighbors(1) == [0]
-        assert (0,1) in gr.edge_properties.keys()
-        assert (1,0) in gr.edge_properties.keys()
-        assert (0,1) in gr.edge_attr.keys()
-        assert (1,0) in gr.edge_attr.keys()
+        assert list(gr.edge_properties.keys()) == [(0,1)]
+        assert list(gr.edge_attr.keys()) == [(0,1)]
+        assert gr.edge_label((1,0)) == "label"
+        assert gr.edge_attributes((1,0)) == [('key','value')]
+        gr.set_edge_label((1,0), "other")
+        gr.add_edge_attribute((1,0), ('key2','value2'))
+        assert gr.edge_label((0,1)) == "other"
+        assert len(gr.edge_attributes((0,1))) == 2
+        assert len(gr.edge_properties) == 1
     
     def test_edges_between_different_nodes_should_be_a_single_arrow(self):
         gr = graph()
@@ -127,6 +185,81 @@ class test_graph(unittest.TestCase):
         assert (0,0) in gr.edge_properties.keys()
         assert (0,0) in gr.edge_attr.keys()
         assert len(gr.edge_attr[(0,0)]) == 1
+    
+    def test_edge_weight_is_shared_by_both_arrows(self):
+        gr = graph()
+        gr.add_nodes([0,1])
+        gr.add_edge((0,1), wt=5)
+        assert gr.edge_weight((0,1)) == 5
+        assert gr.edge_weight((1,0)) == 5
+        gr.set_edge_weight((1,0), 7)
+        assert gr.edge_weight((0,1)) == 7
+        assert gr.node_neighbors == {0: {1: 7}, 1: {0: 7}}
+    
+    def test_unlabeled_edges_use_no_labeling_storage(self):
+        gr = graph()
+        gr.add_nodes([0,1,2])
+        gr.add_edge((0,1), wt=3)
+        gr.add_edge((1,2), label="l")
+        assert gr.edge_label((0,1)) == ""
+        assert gr.edge_label((1,2)) == "l"
+        assert gr.edge_properties == {(1,2): {"label": "l"}}
+        assert sorted(gr.edges()) == [(0,1), (1,0), (1,2), (2,1)]
+    
+    def test_edge_properties_include_weight(self):
+        gr = graph()
+        gr.add_nodes([0,1,2])
+        gr.add_edge((0,1), wt=3, label="l")
+        gr.add_edge((1,2))
+        assert gr.get_edge_properties((1,0)) == {"weight": 3, "label": "l"}
+        assert gr.get_edge_properties((1,2)) == {"weight": 1, "label": ""}
+    
+    def test_weight_of_edge_not_in_graph_is_stored(self):
+        gr = graph()
+        gr.add_nodes([0,1])
+        gr.set_edge_weight((0,1), 5)
+        assert gr.edge_weight((0,1)) == 5
+        gr.set_edge_properties((1,0), weight=6)
+        assert gr.edge_weight((0,1)) == 6
+        assert not gr.has_edge((0,1))
+    
+    def test_change_graph_while_iterating(self):
+        gr = testlib.new_graph()
+        assert list(gr.iter_nodes()) == gr.nodes()
+        for each in gr:
+            for other in gr[each]:
+                gr.del_edge((each, other))
+        assert gr.edges() == []
+        for each in gr:
+            gr.del_node(each)
+        assert gr.nodes() == []
+    
+    def test_neighbors_with_weights(self):
+        gr = testlib.new_graph(wt_range=(1,10))
+        for each in gr:
+            pairs = list(gr.neighbors_with_weights(each))
+            assert [v for v, w in pairs] == gr.neighbors(each)
+            for v, w in pairs:
+                assert w == gr.edge_weight((each, v))
+    
+    def test_graph_containers_are_slotted(self):
+        gr = graph()
+        gr.name = "Some name"
+        assert gr.name == "Some name"
+        assert gr.__dict__ == {'name': "Some name"}
+        assert weakref.ref(gr)() is gr
+    
+    def test_has_edge(self):
+        gr = graph()
+        gr.add_nodes([0,1,2])
+        gr.add_edge((0,1))
+        assert gr.has_edge((0,1))
+        assert gr.has_edge((1,0))
+        assert not gr.has_edge((0,2))
+        assert not gr.has_edge((0,3))
+        assert not gr.has_edge((3,0))
+        gr.del_edge((1,0))
+        assert not gr.has_edge((0,1))
 
     
     # Invert graph
@@ -216,6 +349,20 @@ class test_graph(unittest.TestCase):
         assert isinstance(gr_repr, str )
         assert gr.__class__.__name__ in gr_repr
     
+    def test_str(self):
+        gr = graph()
+        gr.add_nodes([0,1])
+        gr.add_edge((0,1))
+        assert str(gr) == "[0, 1] [(0, 1), (1, 0)]"
+        gr.add_nodes(range(2, 100))
+        assert str(gr) == "[...100 nodes...] [(0, 1), (1, 0)]"
+        gr.complete()
+        assert str(gr) == "[...100 nodes...] [...9900 edges...]"
+        gr = graph()
+        gr.add_nodes([0])
+        gr.add_edge((0,0))
+        assert str(gr) == "[0] [(0, 0)]"
+    
     def test_order_len_equivlance(self):
         """
         Verify the behavior of G.order()
@@ -142,6 +142,52 @@ class test_shortest_path(unittest.TestCase):
             assert False
         except (KeyError):
             pass
+    
+    def test_shortest_path_on_frozen_graph(self):
+        gr = testlib.new_graph(wt_range=(1,10))
+        st, dist = shortest_path(gr.freeze(), 0)
+        assert dist == shortest_path(gr, 0)[1]
+        for each in st:
+            if (st[each] is not None):
+                assert dist[each] == dist[st[each]] + gr.edge_weight((st[each], each))
+    
+    def test_shortest_path_on_frozen_digraph(self):
+        gr = testlib.new_digraph(wt_range=(1,10))
+        st, dist = shortest_path(gr.freeze(), 0)
+        assert dist == shortest_path(gr, 0)[1]
+        for each in st:
+            if (st[each] is not None):
+                assert dist[each] == dist[st[each]] + gr.edge_weight((st[each], each))
+    
+    def test_shortest_path_on_frozen_digraph_with_zero_weights(self):
+        gr = digraph()
+        gr.add_nodes([0,1,2,3])
+        gr.add_edge((0,1), wt=0)
+        gr.add_edge((1,2), wt=0)
+        gr.add_edge((0,2), wt=1)
+        gr.add_edge((2,3), wt=2)
+        st, dist = shortest_path(gr.freeze(), 0)
+        assert dist == {0: 0, 1: 0, 2: 0, 3: 2}
+        assert st == {0: None, 1: 0, 2: 1, 3: 2}
+    
+    def test_shortest_path_on_frozen_digraph_with_heavy_and_fractional_weights(self):
+        for weights in ([1, 10**9], [0.5, 1.5]):
+            gr = digraph()
+            gr.add_nodes([0,1,2])
+            gr.add_edge((0,1), wt=weights[1])
+            gr.add_edge((0,2), wt=weights[0])
+            gr.add_edge((2,1), wt=weights[0])
+            st, dist = shortest_path(gr.freeze(), 0)
+            assert dist == shortest_path(gr, 0)[1]
+            assert st[1] == 2
+    
+    def test_shortest_path_on_frozen_graph_should_fail_if_source_does_not_exist(self):
+        gr = testlib.new_graph().freeze()
+        try:
+            shortest_path(gr, 'invalid')
+            assert False
+        except (KeyError):
+            pass
                 
 class test_shortest_path_bellman_ford(unittest.TestCase):
     
@@ -80,6 +80,16 @@ class test_depth_first_search(unittest.TestCase):
         recursionlimit = getrecursionlimit()
         depth_first_search(gr, 0)
         assert getrecursionlimit() == recursionlimit
+    
+    def test_dfs_in_frozen_graph(self):
+        gr = testlib.new_graph()
+        assert depth_first_search(gr.freeze()) == depth_first_search(gr)
+        assert depth_first_search(gr.freeze(), 0) == depth_first_search(gr, 0)
+    
+    def test_dfs_in_frozen_digraph(self):
+        gr = testlib.new_digraph()
+        assert depth_first_search(gr.freeze()) == depth_first_search(gr)
+        assert depth_first_search(gr.freeze(), 0) == depth_first_search(gr, 0)
 
 class test_breadth_first_search(unittest.TestCase):
 
@@ -113,6 +123,16 @@ class test_breadth_first_search(unittest.TestCase):
                 assert lo.index(each) > lo.index(st[each])
         for node in st:
             assert gr.has_edge((st[node], node)) or st[node] == None
+    
+    def test_bfs_in_frozen_graph(self):
+        gr = testlib.new_graph()
+        assert breadth_first_search(gr.freeze()) == breadth_first_search(gr)
+        assert breadth_first_search(gr.freeze(), 0) == breadth_first_search(gr, 0)
+    
+    def test_bfs_in_frozen_digraph(self):
+        gr = testlib.new_digraph()
+        assert breadth_first_search(gr.freeze()) == breadth_first_search(gr)
+        assert breadth_first_search(gr.freeze(), 0) == breadth_first_search(gr, 0)
             
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
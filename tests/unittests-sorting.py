@@ -29,8 +29,10 @@ Unittests for graph.algorithms.sorting
 
 import unittest
 import pygraph.classes
-from pygraph.algorithms.sorting import topological_sorting
+from pygraph.algorithms.sorting import topological_sorting, reverse_cuthill_mckee, hybrid_bfsdeg
 from pygraph.algorithms.searching import depth_first_search
+from pygraph.algorithms.generators import generate
+from random import seed
 from sys import getrecursionlimit
 import testlib
 
@@ -85,6 +87,52 @@ class test_topological_sorting(unittest.TestCase):
         recursionlimit = getrecursionlimit()
         topological_sorting(gr)
         assert getrecursionlimit() == recursionlimit
+
+
+class test_locality_orderings(unittest.TestCase):
+
+    def test_reverse_cuthill_mckee_on_graph(self):
+        gr = testlib.new_graph()
+        order = reverse_cuthill_mckee(gr)
+        assert sorted(order) == sorted(gr.nodes())
+    
+    def test_reverse_cuthill_mckee_on_shuffled_path(self):
+        gr = pygraph.classes.graph.graph()
+        gr.add_nodes([3, 0, 4, 1, 2])
+        for i in range(4):
+            gr.add_edge((i, i+1))
+        order = reverse_cuthill_mckee(gr)
+        assert order in ([0, 1, 2, 3, 4], [4, 3, 2, 1, 0])
+    
+    def test_reverse_cuthill_mckee_on_frozen_graph(self):
+        gr = testlib.new_graph()
+        assert reverse_cuthill_mckee(gr.freeze()) == reverse_cuthill_mckee(gr)
+    
+    def test_reverse_cuthill_mckee_on_digraph(self):
+        gr = pygraph.classes.digraph.digraph()
+        gr.add_nodes([0, 1, 2, 3])
+        gr.add_edges([(0,3), (1,0), (1,2), (1,3), (2,0), (2,3), (3,0), (3,2)])
+        order = reverse_cuthill_mckee(gr)
+        assert sorted(order) == [0, 1, 2, 3]
+        assert gr.freeze(order).node_list == order
+        gr = pygraph.classes.digraph.digraph()
+        gr.add_nodes([0, 1, 2, 3, 4])
+        gr.add_edges([(0,2), (0,3), (0,4), (1,0), (2,0), (2,3), (3,0), (3,3), (4,3)])
+        assert sorted(reverse_cuthill_mckee(gr)) == [0, 1, 2, 3, 4]
+    
+    def test_reverse_cuthill_mckee_on_random_digraphs(self):
+        for i in range(200):
+            seed(i)
+            gr = generate(8, 16, directed=True)
+            assert sorted(reverse_cuthill_mckee(gr)) == sorted(gr.nodes())
+            assert sorted(reverse_cuthill_mckee(gr.freeze())) == sorted(gr.nodes())
+    
+    def test_hybrid_bfsdeg_on_digraph(self):
+        gr = testlib.new_digraph()
+        order = hybrid_bfsdeg(gr)
+        assert sorted(order) == sorted(gr.nodes())
+        assert gr.node_order(order[0]) == max(gr.node_order(each) for each in gr)
+        assert hybrid_bfsdeg(gr.freeze()) == order
             
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
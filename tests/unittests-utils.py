@@ -0,0 +1,55 @@
+# Copyright (c) Pedro Matiello <pmatiello@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+"""
+python-graph
+
+Unit tests for python-graph
+"""
+
+
+# Imports
+import unittest
+import pygraph
+from pygraph.algorithms.utils import priority_queue
+
+
+class test_priority_queue(unittest.TestCase):
+
+    def test_pop_in_priority_order(self):
+        q = priority_queue()
+        q.insert('a', 3)
+        q.insert('b', 1)
+        q.insert('c', 2)
+        assert len(q) == 3
+        assert q.peek() == 'b'
+        assert [q.pop(), q.pop(), q.pop()] == ['b', 'c', 'a']
+        assert q.empty()
+    
+    def test_discard(self):
+        q = priority_queue([0, 1, 2])
+        q.discard(1)
+        assert 1 not in q
+        assert len(q) == 2
+
+if __name__ == "__main__":
+    unittest.main()